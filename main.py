@@ -2,8 +2,12 @@
 import sys
 import pathlib as pl
 from src import parser
+from src import cache
 
 def main(args):
+    use_cache = '--no-cache' not in args
+    args = [a for a in args if a != '--no-cache']
+
     if len(args) < 2:
         print("The program requires a .sc file as argument.")
         return 1
@@ -17,9 +21,12 @@ def main(args):
         return 1
 
     try:
-        source = path.read_text()
-        tokens = parser.tokenize(source)
-        ast = parser.parse_sc(tokens)
+        if use_cache:
+            ast = cache.load_or_parse(path)
+        else:
+            source = path.read_bytes().decode('utf-8')
+            tokens = parser.tokenize(source)
+            ast = parser.parse_sc(tokens)
         print(ast)
     except Exception as e:
         print("[ERROR]:", str(e))
@@ -1,57 +1,75 @@
 # src/astcollections.py
-from dataclasses import dataclass, field
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
 
 # ===== AST Nodes =====
+# slotted and frozen: nodes are small, immutable and safe to share
 #abstract
-class Node: pass
+class Node:
+    __slots__ = ()
 
-class Statement(Node): pass
-class Expression(Node): pass
+class Statement(Node):
+    __slots__ = ()
+class Expression(Node):
+    __slots__ = ()
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DataType(Node):
     name: str
 
-@dataclass
+    def __reduce__(self):
+        # unpickle through the flyweight cache so loaded ASTs share nodes too
+        return (dtype, (self.name,))
+
+@dataclass(slots=True, frozen=True)
 class Undefined(Expression):
     def __repr__(self):
         return "undefined"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NumberLiteral(Expression):
     value: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StringLiteral(Expression):
     value: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Identifier(Expression):
     name: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VariableDeclaration(Statement):
     name: str
     type: DataType
     value: Optional[Expression] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FunctionDeclaration(Statement):
     name: str
     return_type: DataType
-    parameters: List[str] = field(default_factory=list)
-    block: List[Statement] = field(default_factory=list)
+    parameters: Tuple['Parameter', ...] = ()
+    block: Tuple[Statement, ...] = ()
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Program(Node):
-    statements: List[Statement]
+    statements: Tuple[Statement, ...]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Parameter(Node):
   name: str
   data_type: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Return(Statement):
     value: str = None
+
+# ===== Flyweights =====
+_DTYPE_CACHE: Dict[str, DataType] = {}
+
+def dtype(name: str) -> DataType:
+    """Return the shared DataType node for a type name."""
+    node = _DTYPE_CACHE.get(name)
+    if node is None:
+        node = _DTYPE_CACHE[name] = DataType(name)
+    return node
@@ -0,0 +1,97 @@
+# src/cache.py
+import os
+import pickle
+import hashlib
+import tempfile
+import pathlib as pl
+from src import parser
+import src.astcollections as asts
+
+# ===== Cache config =====
+CACHE_DIR = pl.Path(os.environ.get('XDG_CACHE_HOME') or pl.Path.home() / '.cache') / 'supercode'
+CACHE_MAX_ENTRIES = 50
+
+# modules whose code decides the AST; any edit to them invalidates the cache
+_SRC_DIR = pl.Path(__file__).resolve().parent
+CACHE_SOURCES = ('lexer.py', 'parser.py', 'astcollections.py')
+
+
+def _code_fingerprint() -> bytes:
+    """Hash of the lexer, parser and AST sources, mixed into every cache key."""
+    h = hashlib.sha256()
+    for name in CACHE_SOURCES:
+        h.update((_SRC_DIR / name).read_bytes())
+    return h.digest()
+
+CACHE_FINGERPRINT = _code_fingerprint()
+
+# anything pickle.load can raise for a corrupt or stale entry
+_BAD_ENTRY_ERRORS = (pickle.PickleError, EOFError, AttributeError, ImportError,
+                     ValueError, TypeError, IndexError, KeyError)
+
+
+def _evict(cache_dir: pl.Path, max_entries: int) -> None:
+    """Remove the least recently used entries beyond max_entries."""
+    entries = sorted(cache_dir.glob('*.pkl'), key=lambda p: p.stat().st_mtime)
+    for stale in entries[:-max_entries]:
+        try:
+            stale.unlink()
+        except OSError:
+            pass
+
+
+def _load(entry: pl.Path):
+    """Return the cached Program, or None on a miss; unusable entries are removed."""
+    try:
+        with entry.open('rb') as f:
+            program = pickle.load(f)
+    except OSError:
+        return None  # no entry
+    except _BAD_ENTRY_ERRORS:
+        program = None
+
+    if not isinstance(program, asts.Program):
+        try:
+            entry.unlink()
+        except OSError:
+            pass
+        return None
+
+    try:
+        os.utime(entry)  # mark as recently used
+    except OSError:
+        pass
+    return program
+
+
+def load_or_parse(path: pl.Path, cache_dir: pl.Path = CACHE_DIR) -> asts.Program:
+    """Return the AST for a .sc file, reusing a cached parse of identical source."""
+    source_bytes = path.read_bytes()
+    h = hashlib.sha256(CACHE_FINGERPRINT + source_bytes).hexdigest()
+    entry = cache_dir / f"{h}.pkl"
+
+    program = _load(entry)
+    if program is not None:
+        return program
+
+    program = parser.parse_sc(parser.tokenize(source_bytes.decode('utf-8')))
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # unique temp name, so concurrent writers of the same entry never share a file
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(program, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, entry)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        _evict(cache_dir, CACHE_MAX_ENTRIES)
+    except OSError:
+        pass  # caching is best-effort
+
+    return program
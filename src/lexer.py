@@ -0,0 +1,218 @@
+# src/lexer.py
+import re
+import sys
+import bisect
+from array import array
+from dataclasses import dataclass, field
+from enum import Enum, auto
+from typing import List, Optional
+
+# ===== Token Types =====
+class TokenType(Enum):
+    Keyword = auto()
+    Identifier = auto()
+    Number = auto()
+    EOF = auto()
+    Operator = auto()
+    Delimiter = auto()
+    StringLiteral = auto()
+    DataType = auto()
+
+# ===== Position =====
+class Position:
+    __slots__ = ('coloums', 'row')
+
+    def __init__(self, coloums: int, row: int):
+        self.coloums = coloums
+        self.row = row
+    def __repr__(self):
+        return f"Position(coloums={self.coloums!r}, row={self.row!r})"
+    def __eq__(self, other):
+        if not isinstance(other, Position):
+            return NotImplemented
+        return self.coloums == other.coloums and self.row == other.row
+
+# ===== Token =====
+class Token:
+    __slots__ = ('token_type', 'value', 'position')
+
+    def __init__(self, token_type, value, position=None):
+        self.token_type = token_type
+        self.value = value
+        self.position = position if position is not None else Position(0,0)
+    def __repr__(self):
+        return f"{self.token_type.name}(value:{self.value}, position:{self.position})"
+
+# ===== Token Stream =====
+@dataclass
+class TokenStream:
+    """Tokens stored as parallel arrays; Token objects are only built on demand."""
+    types: array = field(default_factory=lambda: array('b'))  # TokenType values
+    values: List[str] = field(default_factory=list)
+    starts: array = field(default_factory=lambda: array('q'))  # source offsets
+    # rows/columns are only needed for errors, so they are derived from source on demand
+    source: str = field(default='', repr=False, compare=False)
+    _newline_offsets: Optional[List[int]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __len__(self):
+        return len(self.types)
+
+    def __iter__(self):
+        return (self.token(k) for k in range(len(self)))
+
+    def token(self, k: int) -> Token:
+        """Materialize token k (clamped to the trailing EOF)."""
+        if k >= len(self.types):
+            k = len(self.types) - 1
+        return Token(TokenType(self.types[k]), self.values[k], self.position(self.starts[k]))
+
+    def position(self, offset: int) -> Position:
+        """Row/column of a source offset, from a lazily built newline index."""
+        if self._newline_offsets is None:
+            self._newline_offsets = newline_offsets(self.source)
+        return position_at(self._newline_offsets, offset)
+
+# TokenType values as stored in TokenStream.types (the parser dispatches on these)
+KEYWORD = TokenType.Keyword.value
+IDENTIFIER = TokenType.Identifier.value
+NUMBER = TokenType.Number.value
+EOF = TokenType.EOF.value
+OPERATOR = TokenType.Operator.value
+DELIMITER = TokenType.Delimiter.value
+STRING_LITERAL = TokenType.StringLiteral.value
+DATA_TYPE = TokenType.DataType.value
+TOKEN_TYPE_COUNT = max(t.value for t in TokenType) + 1
+
+# ===== Vocabulary =====
+# interned: the lexer hands out these exact objects, so the parser compares with `is`
+FUNCTION_KEYWORD = sys.intern('function')
+DONE_KEYWORD = sys.intern('done')
+ASSIGN_OP = sys.intern('=')
+COLON = sys.intern(':')
+LPAREN = sys.intern('(')
+RPAREN = sys.intern(')')
+COMMA = sys.intern(',')
+SEMICOLON = sys.intern(';')
+EOF_VALUE = sys.intern('EOF')
+RETURN_KEYWORD = sys.intern('return')
+
+# ===== Lexer config =====
+keyword_map = {FUNCTION_KEYWORD, DONE_KEYWORD, RETURN_KEYWORD}
+operator_map = {ASSIGN_OP}
+delimiter_map = {SEMICOLON, COLON, LPAREN, RPAREN, COMMA}
+data_type_map = {sys.intern(name) for name in ('int', 'string', 'bool', 'void')}
+
+# ===== Lexer =====
+# ASCII words take the regex fast path; \w is str.isalnum() plus '_', like the word body.
+# Any other word (non-ASCII start, or digits running into non-ASCII word characters)
+# is matched whole as WORD and split by _split_word with the str.isalpha/isnumeric rules.
+_MASTER_RE = re.compile(r'''
+    (?P<SKIP>(?:\s+|\#[^\n]*)+)                  # whitespace and comments, fused
+  | (?P<ID>[A-Za-z_]\w*)
+  | (?P<NUM>[0-9]+(?![^\W_A-Za-z]))
+  | (?P<WORD>\w+)
+  | (?P<STR>"(?P<STRV>[^"]*)")
+  | (?P<BADSTR>")                                # opening quote with no closing one
+  | (?P<OP>=)
+  | (?P<DEL>[;:(),])
+''', re.VERBOSE)
+
+# group name -> token type (None = skipped)
+_GROUP_KIND = {
+    'SKIP': None,
+    'ID': IDENTIFIER,
+    'NUM': NUMBER,
+    'WORD': None,
+    'STR': STRING_LITERAL,
+    'BADSTR': None,
+    'OP': OPERATOR,
+    'DEL': DELIMITER,
+}
+
+# word -> token type for keywords and data types
+_WORD_KIND = {word: KEYWORD for word in keyword_map}
+_WORD_KIND.update({word: DATA_TYPE for word in data_type_map})
+
+# fixed vocabulary -> its interned constant
+_VOCABULARY = {word: word for word in keyword_map | data_type_map | operator_map | delimiter_map}
+
+def newline_offsets(source: str) -> List[int]:
+    """Offsets of every newline in source, located with str.find."""
+    offsets = []
+    j = source.find('\n')
+    while j >= 0:
+        offsets.append(j)
+        j = source.find('\n', j + 1)
+    return offsets
+
+def position_at(offsets: List[int], offset: int) -> Position:
+    """Row/column of a source offset given the newline offsets of its source."""
+    row = bisect.bisect_right(offsets, offset) + 1
+    line_start = offsets[row - 2] if row > 1 else -1
+    return Position(offset - line_start, row)
+
+def _split_word(word: str):
+    """(token type, value, offset) for each identifier/number run in a WORD match."""
+    j = 0
+    while j < len(word):
+        k = j + 1
+        if word[j].isnumeric():
+            while k < len(word) and word[k].isnumeric():
+                k += 1
+            yield NUMBER, word[j:k], j
+        else:
+            # str.isalpha() or '_': the rest of the match is the word body
+            k = len(word)
+            value = _VOCABULARY.get(word[j:], word[j:])
+            yield _WORD_KIND.get(value, IDENTIFIER), value, j
+        j = k
+
+# ===== Error helper =====
+def get_error_message(msg, position):
+    return f"{msg} on line {position.row}, column {position.coloums}"
+
+def tokenize(source: str) -> TokenStream:
+    tokens = TokenStream(source=source)
+
+    # bind hot globals/attributes to locals once, outside the loop
+    add_type = tokens.types.append
+    add_value = tokens.values.append
+    add_start = tokens.starts.append
+    group_kind = _GROUP_KIND
+    word_kind = _WORD_KIND.get
+    vocabulary = _VOCABULARY.get
+    identifier = IDENTIFIER
+
+    for m in _MASTER_RE.finditer(source):
+        kind = m.lastgroup
+        token_type = group_kind[kind]
+        if token_type is None:
+            if kind == 'BADSTR':
+                position = position_at(newline_offsets(source), m.start())
+                raise Exception(get_error_message("Unterminated string literal", position))
+            if kind == 'WORD':
+                start = m.start()
+                for token_type, value, offset in _split_word(m.group()):
+                    add_type(token_type)
+                    add_value(value)
+                    add_start(start + offset)
+            continue
+
+        if kind == 'STR':
+            # body only, without the quotes
+            value = m.group('STRV')
+        else:
+            value = m.group()
+            value = vocabulary(value, value)
+            if kind == 'ID':
+                token_type = word_kind(value, identifier)
+
+        add_type(token_type)
+        add_value(value)
+        add_start(m.start())
+
+    add_type(EOF)
+    add_value(EOF_VALUE)
+    add_start(len(source))
+
+    return tokens
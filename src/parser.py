@@ -1,296 +1,198 @@
 # src/parser.py
-from enum import Enum, auto
-from dataclasses import dataclass
-from typing import List, Callable
+from types import MethodType
+import functools
+from typing import List, Callable, Dict, Optional, Tuple
 import src.astcollections as asts
-
-# ===== Token Types =====
-class TokenType(Enum):
-    Keyword = auto()
-    Identifier = auto()
-    Number = auto()
-    EOF = auto()
-    Operator = auto()
-    Delimiter = auto()
-    StringLiteral = auto()
-    DataType = auto()
-
-# ===== Position =====
-@dataclass
-class Position:
-    coloums: int
-    row: int
-
-# ===== Token =====
-class Token:
-    def __init__(self, token_type, value):
-        self.token_type = token_type
-        self.value = value
-        self.position = Position(0,0)
-    def __repr__(self):
-        return f"{self.token_type.name}(value:{self.value}, position:{self.position})"
-
-# ===== Parser Constants =====
-FUNCTION_KEYWORD = 'function'
-DONE_KEYWORD = 'done'
-ASSIGN_OP = '='
-COLON = ':'
-LPAREN = '('
-RPAREN = ')'
-COMMA = ','
-SEMICOLON = ';'
-EOF_VALUE = 'EOF'
-RETURN_KEYWORD = 'return'
-
-# ===== Lexer config =====
-keyword_map = {FUNCTION_KEYWORD, DONE_KEYWORD, RETURN_KEYWORD}
-operator_map = {ASSIGN_OP}
-delimiter_map = {SEMICOLON, COLON, LPAREN, RPAREN, COMMA}
-data_type_map = {'int', 'string', 'bool', 'void'}
+from src.lexer import (
+    TokenType, Position, Token, TokenStream, tokenize, get_error_message,
+    FUNCTION_KEYWORD, DONE_KEYWORD, ASSIGN_OP, COLON, LPAREN, RPAREN, COMMA, SEMICOLON, EOF_VALUE, RETURN_KEYWORD,
+    keyword_map, operator_map, delimiter_map, data_type_map,
+    KEYWORD, IDENTIFIER, NUMBER, EOF, OPERATOR, DELIMITER, STRING_LITERAL, DATA_TYPE, TOKEN_TYPE_COUNT,
+)
+
+# the lexer names below lived in this module before src/lexer.py; re-exported so parser.X keeps working
+__all__ = [
+    'Parser', 'parse_sc', 'default_values',
+    'TokenType', 'Position', 'Token', 'tokenize', 'get_error_message',
+    'FUNCTION_KEYWORD', 'DONE_KEYWORD', 'ASSIGN_OP', 'COLON', 'LPAREN', 'RPAREN', 'COMMA', 'SEMICOLON',
+    'EOF_VALUE', 'RETURN_KEYWORD',
+    'keyword_map', 'operator_map', 'delimiter_map', 'data_type_map',
+]
+
+# expression node class per token type (None = not an expression)
+_EXPRESSION_NODES = [None] * TOKEN_TYPE_COUNT
+_EXPRESSION_NODES[NUMBER] = asts.NumberLiteral
+_EXPRESSION_NODES[STRING_LITERAL] = asts.StringLiteral
+_EXPRESSION_NODES[IDENTIFIER] = asts.Identifier
 
 # ===== Default values (runtime) =====
 default_values = {'int':'0', 'string':'""', 'bool':'false'}
 
 
-# ===== Lexer =====
-def tokenize(source: str) -> List[Token]:
-    tokens = []
-    i = 0
-    row = 1
-    column = 1
+# ===== Packrat memoization =====
+def memoize(fn):
+    """Cache a parse method's result and end position by token index."""
+    name = fn.__name__
 
-    def advance():
-        nonlocal i, column, row
-        if source[i] == '\n':
-            row += 1
-            column = 1
-        else:
-            column += 1
-        i += 1
-
-    while i < len(source):
-        c = source[i]
-
-        #comments
-        if c == '#':
-            while i < len(source) and c != '\n':
-                advance()
-
-        if c.isspace():
-            advance()
-            continue
-
-        # Identifier / Keyword / DataType
-        if c.isalpha() or c == '_':
-            start_row, start_column = row, column
-            word = []
-            while i < len(source) and (source[i].isalnum() or source[i] == '_'):
-                word.append(source[i])
-                advance()
-            word = ''.join(word)
-            if word in keyword_map:
-                token_type = TokenType.Keyword
-            elif word in data_type_map:
-                token_type = TokenType.DataType
-            else:
-                token_type = TokenType.Identifier
-            t = Token(token_type, word)
-            t.position = Position(start_column, start_row)
-            tokens.append(t)
-            continue
-
-        # Number
-        if c.isnumeric():
-            start_row, start_column = row, column
-            num = []
-            while i < len(source) and source[i].isnumeric():
-                num.append(source[i])
-                advance()
-            t = Token(TokenType.Number, ''.join(num))
-            t.position = Position(start_column, start_row)
-            tokens.append(t)
-            continue
-
-        # Operator
-        if c in operator_map:
-            t = Token(TokenType.Operator, c)
-            t.position = Position(column, row)
-            tokens.append(t)
-            advance()
-            continue
-
-        # Delimiter
-        if c in delimiter_map:
-            t = Token(TokenType.Delimiter, c)
-            t.position = Position(column, row)
-            tokens.append(t)
-            advance()
-            continue
-
-        # String literal
-        if c == '"':
-            start_row, start_column = row, column
-            word = []
-            advance()
-            while i < len(source) and source[i] != '"':
-                word.append(source[i])
-                advance()
-            advance()
-            t = Token(TokenType.StringLiteral, ''.join(word))
-            t.position = Position(start_column, start_row)
-            tokens.append(t)
-            continue
-
-        # unknown char → skip
-        advance()
-
-    eof = Token(TokenType.EOF, EOF_VALUE)
-    eof.position = Position(column,row)
-    tokens.append(eof)
-
-    return tokens
-
-# ===== Error helper =====
-def get_error_message(msg, position):
-    return f"{msg} on line {position.row}, column {position.coloums}"
+    @functools.wraps(fn)
+    def wrapper(self):
+        memo = self._memo
+        key = (name, self.i)
+        if key in memo:
+            result, self.i = memo[key]
+            return result
+        result = fn(self)
+        memo[key] = (result, self.i)
+        return result
+    return wrapper
 
 # ===== Parser Class =====
 class Parser:
-    def __init__(self, tokens: List[Token]):
+    def __init__(self, tokens: TokenStream, packrat: bool = False):
         self.tokens = tokens
+        self.types = tokens.types
+        self.values = tokens.values
         self.i = 0
+        # opt-in: the grammar is LL(1), so caching only pays off once rules backtrack.
+        # The memoized rules are bound per instance so the default path pays nothing.
+        self._memo: Optional[Dict[Tuple[str, int], Tuple[object, int]]] = None
+        self._top_handlers = _TOP_HANDLERS
+        self._block_handlers = _BLOCK_HANDLERS
+        if packrat:
+            self._memo = {}
+            for name, rule in _PACKRAT_RULES.items():
+                setattr(self, name, MethodType(rule, self))
+            self._top_handlers = _PACKRAT_TOP_HANDLERS
+            self._block_handlers = _PACKRAT_BLOCK_HANDLERS
 
     def consume(self, step: int = 1) -> None:
         """Advance the token pointer by step positions."""
         self.i += step
 
-    def look_ahead(self, step: int, condition:Callable[[Token], bool]) -> bool:
-        """Check if a token ahead satisfies the condition."""
-        return self.i + step < len(self.tokens) and condition(self.tokens[self.i + step])
+    def at(self, token_type: int, value: str) -> bool:
+        """Check the current token's type and (interned) value.
+
+        The type check matters: a one-character string literal such as ";" has a
+        body that CPython caches, so it is the same object as SEMICOLON.
+        """
+        return self.types[self.i] == token_type and self.values[self.i] is value
+
+    def look_ahead_type(self, step: int, token_type: int) -> bool:
+        """Check if the token step positions ahead has the given type tag (e.g. IDENTIFIER)."""
+        k = self.i + step
+        return k < len(self.types) and self.types[k] == token_type
+
+    def look_ahead_value(self, step: int, value: str) -> bool:
+        """Check if the token step positions ahead is the given (interned) value."""
+        k = self.i + step
+        return k < len(self.values) and self.values[k] is value and self.types[k] != STRING_LITERAL
 
     def current_token(self) -> Token:
-        """Get the current token."""
-        if self.i < len(self.tokens):
-            return self.tokens[self.i]
-        return self.tokens[-1]  # Return EOF if out of bounds
+        """Get the current token (EOF if out of bounds); only needed for error reporting."""
+        return self.tokens.token(self.i)
 
     def parse_expression(self):
         """Parse an expression (number, string, or identifier)."""
-        token = self.current_token()
-        match token.token_type:
-            case TokenType.Number:
-                self.consume()
-                return asts.NumberLiteral(token.value)
-            case TokenType.StringLiteral:
-                self.consume()
-                return asts.StringLiteral(token.value)
-            case TokenType.Identifier:
-                self.consume()
-                return asts.Identifier(token.value)
-            case _:
-                raise Exception(get_error_message(f"Unexpected token '{token.value}'", token.position))
+        value = self.values[self.i]
+        node = _EXPRESSION_NODES[self.types[self.i]]
+        if node is None:
+            raise Exception(get_error_message(f"Unexpected token '{value}'", self.current_token().position))
+        self.consume()
+        return node(value)
 
     def parse_variable(self):
         """Parse a variable declaration."""
-        if self.current_token().token_type != TokenType.DataType:
+        if self.types[self.i] != DATA_TYPE:
             raise Exception(get_error_message("Expected data type for variable", self.current_token().position))
-        dtype = self.current_token().value
+        dtype = self.values[self.i]
         self.consume()
 
-        if self.current_token().token_type != TokenType.Identifier:
+        if self.types[self.i] != IDENTIFIER:
             raise Exception(get_error_message("Expected variable name", self.current_token().position))
-        name_token = self.current_token()
+        name = self.values[self.i]
         self.consume()
 
-        if self.current_token().value == ASSIGN_OP:
+        if self.at(OPERATOR, ASSIGN_OP):
             self.consume()
             expr = self.parse_expression()
         else:
             expr = None  # default value nanti runtime
 
-        if self.current_token().value != SEMICOLON:
-            raise Exception(get_error_message(f"Expected '{SEMICOLON}' after variable '{name_token.value}'", self.current_token().position))
+        if not self.at(DELIMITER, SEMICOLON):
+            raise Exception(get_error_message(f"Expected '{SEMICOLON}' after variable '{name}'", self.current_token().position))
         self.consume()
-        return asts.VariableDeclaration(name_token.value, asts.DataType(dtype), expr)
+        return asts.VariableDeclaration(name, asts.dtype(dtype), expr)
 
     def parse_block(self):
         """Parse a block of statements between ':' and 'done'."""
         statements = []
-        if self.current_token().value != COLON:
+        if not self.at(DELIMITER, COLON):
             raise Exception(get_error_message(f"Expected '{COLON}' to start block", self.current_token().position))
         self.consume()
-        while self.current_token().value != DONE_KEYWORD:
-            t = self.current_token()
-            match t.token_type:
-                case TokenType.DataType:
-                    var = self.parse_variable()
-                    statements.append(var)
-                case TokenType.Keyword:
-                    if t.value == FUNCTION_KEYWORD:
-                        statements.append(self.parse_function())
-                        continue
-                    if t.value == RETURN_KEYWORD:
-                        statements.append(self.parse_return())
-                case _:
-                    statements.append(self.parse_expression())
-                        
+        types, values = self.types, self.values
+        handlers = self._block_handlers
+        while not self.at(KEYWORD, DONE_KEYWORD):
+            tt = types[self.i]
+            handler = handlers.get((tt, values[self.i] if tt == KEYWORD else None))
+            statements.append(handler(self) if handler is not None else self.parse_expression())
+
         self.consume()  # consume done
-        return statements
+        return tuple(statements)
 
     def parse_parameter(self):
         """Parse a function parameter."""
-        if self.current_token().token_type != TokenType.DataType:
+        if self.types[self.i] != DATA_TYPE:
             raise Exception(get_error_message("Expected parameter type", self.current_token().position))
-        dtype = self.current_token().value
+        dtype = self.values[self.i]
         self.consume()
 
-        if self.current_token().token_type != TokenType.Identifier:
+        if self.types[self.i] != IDENTIFIER:
             raise Exception(get_error_message("Expected parameter name", self.current_token().position))
-        name = self.current_token().value
+        name = self.values[self.i]
         self.consume()
 
-        return asts.Parameter(asts.Identifier(name), asts.DataType(dtype))
+        return asts.Parameter(asts.Identifier(name), asts.dtype(dtype))
 
     def parse_function(self):
         """Parse a function declaration."""
         self.consume()  # consume FUNCTION_KEYWORD
 
-        if self.current_token().token_type != TokenType.DataType:
+        if self.types[self.i] != DATA_TYPE:
             raise Exception(get_error_message("Expected return type for function", self.current_token().position))
-        ret_type = self.current_token().value
+        ret_type = self.values[self.i]
         self.consume()
 
-        if self.current_token().token_type != TokenType.Identifier:
+        if self.types[self.i] != IDENTIFIER:
             raise Exception(get_error_message("Expected function name", self.current_token().position))
-        name = self.current_token().value
+        name = self.values[self.i]
         self.consume()
 
-        if self.current_token().value != LPAREN:
+        if not self.at(DELIMITER, LPAREN):
             raise Exception(get_error_message(f"Expected '{LPAREN}' after function name", self.current_token().position))
         self.consume()
         param = []
 
-        if self.current_token().value != RPAREN:
+        if not self.at(DELIMITER, RPAREN):
             while True:
                 param.append(self.parse_parameter())
         
-                if self.current_token().value == COMMA:
+                if self.at(DELIMITER, COMMA):
                     self.consume()
                     continue
                 break
       
-        if self.current_token().value != RPAREN:
+        if not self.at(DELIMITER, RPAREN):
             raise Exception(get_error_message(f"Expected '{RPAREN}' after function parameters", self.current_token().position))
         self.consume()
 
         body = self.parse_block()
-        return asts.FunctionDeclaration(name, asts.DataType(ret_type), param, body)
+        return asts.FunctionDeclaration(name, asts.dtype(ret_type), tuple(param), body)
     
     def parse_return(self):
         self.consume()  # consume 'return'
-        if self.current_token().value != SEMICOLON:
+        if not self.at(DELIMITER, SEMICOLON):
             expr = self.parse_expression()
-            if self.current_token().value != SEMICOLON:
+            if not self.at(DELIMITER, SEMICOLON):
                 raise Exception(get_error_message(f"Expected '{SEMICOLON}' after return expression", self.current_token().position))
             self.consume()  # consume semicolon
             return asts.Return(expr)
@@ -302,25 +204,42 @@ class Parser:
         """Parse the tokens and return the AST."""
         result_ast: List[asts.Statement] = []
 
-        while self.current_token().token_type != TokenType.EOF:
-            t = self.current_token()
-            match t.token_type:
-                case TokenType.DataType:
-                    var = self.parse_variable()
-                    result_ast.append(var)
-                    continue
-                case TokenType.Keyword:
-                    if t.value == FUNCTION_KEYWORD:
-                        func = self.parse_function()
-                        result_ast.append(func)
-                        continue
-            self.consume()
+        types, values = self.types, self.values
+        handlers = self._top_handlers
+        while (tt := types[self.i]) != EOF:
+            handler = handlers.get((tt, values[self.i] if tt == KEYWORD else None))
+            if handler is not None:
+                result_ast.append(handler(self))
+                continue
+            self.consume()  # skip tokens that do not start a top-level statement
+
+        return asts.Program(tuple(result_ast))
+
+
+# rules wrapped with memoize when a Parser is created with packrat=True
+_PACKRAT_RULES = {
+    name: memoize(getattr(Parser, name))
+    for name in ('parse_expression', 'parse_variable', 'parse_block',
+                 'parse_parameter', 'parse_function', 'parse_return')
+}
+
+HandlerTable = Dict[Tuple[int, Optional[str]], Callable[[Parser], asts.Statement]]
+
+def _statement_handlers(rules) -> Tuple[HandlerTable, HandlerTable]:
+    """Build the top-level and block handler tables, keyed by (token type, keyword or None)."""
+    top = {
+        (DATA_TYPE, None): rules['parse_variable'],
+        (KEYWORD, FUNCTION_KEYWORD): rules['parse_function'],
+    }
+    block = {**top, (KEYWORD, RETURN_KEYWORD): rules['parse_return']}
+    return top, block
 
-        return asts.Program(result_ast)
+_TOP_HANDLERS, _BLOCK_HANDLERS = _statement_handlers(vars(Parser))
+_PACKRAT_TOP_HANDLERS, _PACKRAT_BLOCK_HANDLERS = _statement_handlers(_PACKRAT_RULES)
 
 
 # ===== Parser function wrapper =====
-def parse_sc(tokens: List[Token]) -> asts.Program:
-    """Parse a list of tokens and return the AST."""
-    parser = Parser(tokens)
+def parse_sc(tokens: TokenStream, packrat: bool = False) -> asts.Program:
+    """Parse a token stream and return the AST."""
+    parser = Parser(tokens, packrat)
     return parser.parse()
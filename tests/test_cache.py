@@ -0,0 +1,57 @@
+# tests/test_cache.py
+import os
+import hashlib
+import tempfile
+import unittest
+import pathlib as pl
+from src import cache
+import src.astcollections as asts
+
+SOURCE = b'int x = 5;\nstring s = "hi";\n'
+
+
+class LoadOrParseTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = pl.Path(tmp.name)
+        self.cache_dir = self.root / 'cache'
+        self.path = self.root / 'prog.sc'
+        self.path.write_bytes(SOURCE)
+
+    def entry(self) -> pl.Path:
+        h = hashlib.sha256(cache.CACHE_FINGERPRINT + SOURCE).hexdigest()
+        return self.cache_dir / f"{h}.pkl"
+
+    def test_hit_returns_equal_program(self):
+        first = cache.load_or_parse(self.path, self.cache_dir)
+        self.assertTrue(self.entry().exists())
+        self.assertEqual(cache.load_or_parse(self.path, self.cache_dir), first)
+
+    def test_garbage_entry_is_reparsed_and_replaced(self):
+        self.cache_dir.mkdir()
+        self.entry().write_bytes(b'not a pickle')
+
+        program = cache.load_or_parse(self.path, self.cache_dir)
+
+        self.assertIsInstance(program, asts.Program)
+        self.assertIs(cache._load(self.entry()).statements[0].type, asts.dtype('int'))
+        self.assertEqual(list(self.cache_dir.glob('*.tmp')), [])
+
+    def test_directory_is_trimmed_to_max_entries(self):
+        self.cache_dir.mkdir()
+        for n in range(cache.CACHE_MAX_ENTRIES + 5):
+            old = self.cache_dir / f"{n:064x}.pkl"
+            old.write_bytes(b'')
+            os.utime(old, (n, n))
+
+        cache.load_or_parse(self.path, self.cache_dir)
+
+        entries = list(self.cache_dir.glob('*.pkl'))
+        self.assertEqual(len(entries), cache.CACHE_MAX_ENTRIES)
+        self.assertIn(self.entry(), entries)
+        self.assertNotIn(self.cache_dir / f"{0:064x}.pkl", entries)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+# tests/test_parser.py
+import unittest
+from src.parser import Parser, tokenize
+from src.lexer import IDENTIFIER, NUMBER, DELIMITER, ASSIGN_OP, SEMICOLON
+
+
+class LookAheadTest(unittest.TestCase):
+    def setUp(self):
+        self.parser = Parser(tokenize('int x = 5; string s = ";";'))
+
+    def test_look_ahead_type(self):
+        self.assertTrue(self.parser.look_ahead_type(1, IDENTIFIER))
+        self.assertTrue(self.parser.look_ahead_type(3, NUMBER))
+        self.assertFalse(self.parser.look_ahead_type(2, IDENTIFIER))
+
+    def test_look_ahead_value(self):
+        self.assertTrue(self.parser.look_ahead_value(2, ASSIGN_OP))
+        self.assertTrue(self.parser.look_ahead_value(4, SEMICOLON))
+        self.assertFalse(self.parser.look_ahead_value(3, SEMICOLON))
+
+    def test_look_ahead_is_relative_to_current_token(self):
+        self.parser.consume(2)
+        self.assertTrue(self.parser.look_ahead_value(0, ASSIGN_OP))
+        self.assertTrue(self.parser.look_ahead_type(2, DELIMITER))
+
+    def test_string_literal_is_not_a_delimiter(self):
+        # the body of ";" is the cached 1-char string, identical to SEMICOLON
+        self.assertIs(self.parser.values[8], SEMICOLON)
+        self.assertFalse(self.parser.look_ahead_value(8, SEMICOLON))
+        self.assertTrue(self.parser.look_ahead_value(9, SEMICOLON))
+
+    def test_past_end_is_false(self):
+        self.assertFalse(self.parser.look_ahead_type(100, IDENTIFIER))
+        self.assertFalse(self.parser.look_ahead_value(100, SEMICOLON))
+
+
+if __name__ == '__main__':
+    unittest.main()